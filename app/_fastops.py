@@ -0,0 +1,51 @@
+"""
+Fast numeric kernels shared by the operation classes.
+
+CPython already ships the mpdecimal C library through the _decimal module,
+so these helpers keep exponentiation on that native path instead of
+bouncing through Python-level float conversions. A compiled Cython shim
+against libmpdec was considered and rejected: this project has no C build
+chain, and Decimal's **, sqrt, ln and exp already execute in C.
+"""
+
+from decimal import Decimal, localcontext
+
+
+def pow_decimal(a: Decimal, b: Decimal) -> Decimal:
+    """
+    Raise a to the power b entirely on the native Decimal path.
+
+    Arguments:
+        a: Base value
+        b: Exponent value
+
+    Returns:
+        Decimal: a raised to the power b
+    """
+    a, b = Decimal(a), Decimal(b)
+    if b == b.to_integral_value(): # Exact result for whole-number exponents
+        return a ** int(b)
+    if a == 0:
+        return Decimal(0)
+    with localcontext(): # One native ln + exp, no float round-trip
+        return (b * a.ln()).exp()
+
+
+def root_decimal(a: Decimal, b: Decimal) -> Decimal:
+    """
+    Take the b-th root of a entirely on the native Decimal path.
+
+    Arguments:
+        a: Value to take the root of
+        b: Degree of the root
+
+    Returns:
+        Decimal: the b-th root of a
+    """
+    a, b = Decimal(a), Decimal(b)
+    if b == 2: # Square root is correctly rounded in Decimal
+        return a.sqrt()
+    if a == 0:
+        return Decimal(0)
+    with localcontext(): # One native ln + exp, no float round-trip
+        return (a.ln() / b).exp()
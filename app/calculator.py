@@ -1,12 +1,16 @@
+from collections import deque
 from dataclasses import dataclass, field
 import datetime
 from decimal import Decimal
+import io
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 # Modular programming
 from app.calculator_operations import CalculatorOperations
 from app.calculator_config import CalculatorConfig
@@ -18,10 +22,23 @@ from app.operations import Operation, OperationFactory
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
+_HIST_COLUMNS = ('operation', 'operand1', 'operand2', 'result', 'timestamp')
+
+_CSV_HEADER = ','.join(_HIST_COLUMNS) + '\n'
+
+# Fixed schema for the legacy CSV history format; passing it to read_csv
+# skips pandas' two-pass type inference over every row
+_HIST_DTYPES = {
+    'operation': 'string',
+    'operand1': 'string',
+    'operand2': 'string',
+    'result': 'string'
+}
+
 @dataclass
 class CalculatorMemento:
     """Stores calculator state for undo/redo functionality."""
-    history: List[CalculatorOperations]
+    history: Deque[CalculatorOperations]
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -35,7 +52,9 @@ class CalculatorMemento:
     def from_dict(cls, data: Dict[str, Any]) -> 'CalculatorMemento':
         """Create memento from dictionary."""
         return cls(
-            history=[CalculatorOperations.from_dict(calc) for calc in data['history']],
+            history=deque(
+                CalculatorOperations.from_dict(calc) for calc in data['history']
+            ),
             timestamp=datetime.datetime.fromisoformat(data['timestamp'])
         )
 
@@ -56,11 +75,27 @@ class Calculator:
         
         self._setup_logging()
         
-        self.history: List[CalculatorOperations] = []
+        # Bounded deques: O(1) append/evict instead of list pop(0) shifts
+        self.history: Deque[CalculatorOperations] = deque(
+            maxlen=config.max_history_size
+        )
+        # Column-wise (SoA) mirror of self.history, appended as operations
+        # happen so saves never transpose a list of per-row dicts
+        self._hist_cols: Dict[str, List[str]] = {col: [] for col in _HIST_COLUMNS}
+        # Pre-serialized CSV lines; a save is then a single buffer write
+        # instead of re-formatting every row through to_csv
+        self._csv_buf = io.StringIO()
+        self._csv_buf.write(_CSV_HEADER)
+        # Set when rows are trimmed from the columns without re-serializing
+        # the CSV buffer; the rebuild is deferred to the next save
+        self._csv_buf_stale = False
+        # True whenever the on-disk history file may hold rows that the
+        # in-memory history no longer does; appends must not trust it then
+        self._history_file_dirty = True
         self.operation_strategy: Optional[Operation] = None
         self.observers: List[HistoryObserver] = []
-        self.undo_stack: List[CalculatorMemento] = []
-        self.redo_stack: List[CalculatorMemento] = []
+        self.undo_stack: Deque[CalculatorMemento] = deque(maxlen=config.max_history_size)
+        self.redo_stack: Deque[CalculatorMemento] = deque(maxlen=config.max_history_size)
         
         self._setup_directories()
         
@@ -103,6 +138,8 @@ class Calculator:
 
     def notify_observers(self, calculatorOperations: CalculatorOperations) -> None:
         """Notify all observers of new operations."""
+        if not self.observers: # Fast path, nothing registered
+            return
         for observer in self.observers:
             observer.update(calculatorOperations)
 
@@ -131,9 +168,29 @@ class Calculator:
             )
             self.undo_stack.append(CalculatorMemento(self.history.copy()))
             self.redo_stack.clear()
+            # A full deque evicts its oldest row silently on append, so
+            # the cap has to be checked before appending
+            evicting = (
+                self.history.maxlen is not None
+                and len(self.history) == self.history.maxlen
+            )
             self.history.append(calculatorOperations)
+            self._append_hist_row(calculatorOperations)
+            if evicting:
+                for column in self._hist_cols.values():
+                    if column:
+                        column.pop(0)
+                self._csv_buf_stale = True
+                self._history_file_dirty = True # Evicted row may still be on disk
+            # The deque evicts at its own maxlen; this handles the config
+            # shrinking below it after construction
             if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+                self.history.popleft()
+                for column in self._hist_cols.values():
+                    if column:
+                        column.pop(0)
+                self._csv_buf_stale = True
+                self._history_file_dirty = True # Evicted row may still be on disk
             self.notify_observers(calculatorOperations)
             return result
 
@@ -144,26 +201,120 @@ class Calculator:
             logging.error(f"Operation failed: {str(e)}")
             raise OperationError(f"Operation failed: {str(e)}")
 
+    def _append_hist_row(self, calc: CalculatorOperations) -> None:
+        """Append one operation's string forms to the column buffer."""
+        cols = self._hist_cols
+        operation = str(calc.operation)
+        operand1 = str(calc.operand1)
+        operand2 = str(calc.operand2)
+        result = str(calc.result)
+        timestamp = calc.timestamp.isoformat()
+        cols['operation'].append(operation)
+        cols['operand1'].append(operand1)
+        cols['operand2'].append(operand2)
+        cols['result'].append(result)
+        cols['timestamp'].append(timestamp)
+        # None of the fields can contain a comma, so no quoting is needed
+        self._csv_buf.write(f"{operation},{operand1},{operand2},{result},{timestamp}\n")
+
+    def _rebuild_csv_buf(self) -> None:
+        """Re-serialize the CSV buffer from the column buffer."""
+        cols = self._hist_cols
+        self._csv_buf = io.StringIO()
+        self._csv_buf.write(_CSV_HEADER)
+        for row in zip(*(cols[col] for col in _HIST_COLUMNS)):
+            self._csv_buf.write(','.join(row) + '\n')
+        self._csv_buf_stale = False
+
+    def _rebuild_hist_buffers(self) -> None:
+        """Rebuild the column and CSV buffers from self.history."""
+        self._hist_cols = {col: [] for col in _HIST_COLUMNS}
+        self._csv_buf = io.StringIO()
+        self._csv_buf.write(_CSV_HEADER)
+        for calc in self.history:
+            self._append_hist_row(calc)
+        self._csv_buf_stale = False
+
+    def _sync_hist_cols(self) -> None:
+        """Rebuild the column buffer if it drifted from self.history."""
+        # Callers (and tests) can still mutate self.history directly; a
+        # length mismatch is the remaining cue that the buffers drifted
+        if len(self._hist_cols['operation']) != len(self.history):
+            self._rebuild_hist_buffers()
+        elif self._csv_buf_stale: # Columns trimmed in place since last save
+            self._rebuild_csv_buf()
+
+    def _append_history_row(self, calc: CalculatorOperations) -> bool:
+        """
+        Append one operation to the history file without a full rewrite.
+
+        Rewriting the whole history on every autosave is O(N^2) over a
+        session; CSV and JSON-lines files take an O(1) append instead.
+        Returns True once the file is current, or False for formats with
+        no row-append (Parquet) so the caller can batch full saves.
+        """
+        history_file = self.config.history_file
+        suffix = history_file.suffix
+        if suffix not in ('.csv', '.jsonl'):
+            return False
+        if self._history_file_dirty:
+            # Undo/redo/clear/eviction left rows on disk that history no
+            # longer holds; appending would resurrect them on reload
+            self.save_history()
+            return True
+        self.config.history_dir.mkdir(parents=True, exist_ok=True)
+        if suffix == '.jsonl':
+            with open(history_file, 'ab') as handle:
+                handle.write(calc.to_json())
+                handle.write(b'\n')
+            return True
+        data = calc.to_dict()
+        line = ','.join((
+            data['operation'], data['operand1'], data['operand2'],
+            data['result'], data['timestamp']
+        )) + '\n'
+        needs_header = not history_file.exists() or history_file.stat().st_size == 0
+        with open(
+            history_file, 'a', encoding=self.config.default_encoding, newline=''
+        ) as handle:
+            if needs_header:
+                handle.write(_CSV_HEADER)
+            handle.write(line)
+        return True
+
+    def _write_history_csv(self, history_file: Path) -> None:
+        """Dump the pre-serialized CSV buffer to disk in one write."""
+        with open(
+            history_file, 'w', encoding=self.config.default_encoding, newline=''
+        ) as handle:
+            handle.write(self._csv_buf.getvalue())
+
     def save_history(self) -> None:
-        """Panda implementation, save calc history to CSV."""
+        """Panda implementation, save calc history to file."""
         try:
             self.config.history_dir.mkdir(parents=True, exist_ok=True)
-            history_data = []
-            for calc in self.history:
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-            if history_data:
-                df = pd.DataFrame(history_data)
-                df.to_csv(self.config.history_file, index=False)
-                logging.info(f"History saved successfully to {self.config.history_file}")
+            self._sync_hist_cols()
+            history_file = self.config.history_file
+            if history_file.suffix == '.parquet':
+                # Columnar format: much faster to parse back and far smaller
+                # on disk than CSV tokenization; column dict -> DataFrame
+                # skips the per-row dict transpose
+                df = pd.DataFrame(self._hist_cols, copy=False)
+                df.to_parquet(
+                    history_file, engine='pyarrow', compression='snappy', index=False
+                )
+            elif history_file.suffix == '.jsonl':
+                # One JSON document per line; orjson emits bytes directly
+                with open(history_file, 'wb') as handle:
+                    for calc in self.history:
+                        handle.write(calc.to_json())
+                        handle.write(b'\n')
+            else: # Legacy CSV path, kept for older history files
+                self._write_history_csv(history_file)
+            self._history_file_dirty = False # Full rewrite, file is current
+            if self.history:
+                logging.info(f"History saved successfully to {history_file}")
             else:
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                           ).to_csv(self.config.history_file, index=False)
                 logging.info("Empty history saved")
                 
         except Exception as e:
@@ -174,39 +325,76 @@ class Calculator:
         """Load calculation history from CSV file using pandas."""
         try:
             if self.config.history_file.exists():
-                df = pd.read_csv(self.config.history_file)
+                history_file = self.config.history_file
+                if history_file.suffix == '.jsonl':
+                    self._load_history_jsonl(history_file)
+                    return
+                if history_file.suffix == '.parquet':
+                    df = pd.read_parquet(
+                        history_file,
+                        columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
+                    )
+                else: # Legacy CSV path, kept for older history files
+                    df = pd.read_csv(
+                        history_file,
+                        dtype=_HIST_DTYPES,
+                        parse_dates=['timestamp'],
+                        date_format='ISO8601',
+                        engine='c'
+                    )
                 if not df.empty:
-                    self.history = [
-                        CalculatorOperations.from_dict({
-                            'operation': row['operation'],
-                            'operand1': row['operand1'],
-                            'operand2': row['operand2'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
+                    # Recompute under the ambient context, the same one
+                    # perform_operation ran under, so reloads reproduce
+                    # every inexact result bit-for-bit
+                    self.history = deque(
+                        CalculatorOperations.from_dataframe(
+                            df,
+                            trust_results=self.config.trust_history
+                        ),
+                        maxlen=self.config.max_history_size
+                    )
+                    # The loaded history can match the old one in length,
+                    # so the buffers must be rebuilt unconditionally
+                    self._rebuild_hist_buffers()
                     logging.info(f"Loaded {len(self.history)} calculations from history")
                 else:
                     logging.info("Loaded empty history file") # History file found but no data
             else:
                 logging.info("No history file found - starting with empty history") # No history file found
+            self._history_file_dirty = False # File and history now agree
         except Exception as e:
             logging.error(f"Failed to load history: {e}")
             raise OperationError(f"Failed to load history: {e}")
 
+    def _load_history_jsonl(self, history_file: Path) -> None:
+        """Load history from a JSON-lines file written by save_history."""
+        with open(history_file, 'rb') as handle:
+            rows = [orjson.loads(line) for line in handle if line.strip()]
+        if rows:
+            self.history = deque(
+                CalculatorOperations.from_records(
+                    rows, trust_results=self.config.trust_history
+                ),
+                maxlen=self.config.max_history_size
+            )
+            self._rebuild_hist_buffers()
+            logging.info(f"Loaded {len(self.history)} calculations from history")
+        else:
+            logging.info("Loaded empty history file")
+        self._history_file_dirty = False # File and history now agree
+
     def get_history_dataframe(self) -> pd.DataFrame:
         """Get calculation history as a pandas DataFrame."""
-        history_data = []
-        for calc in self.history:
-            history_data.append({
-                'operation': str(calc.operation),
-                'operand1': str(calc.operand1),
-                'operand2': str(calc.operand2),
-                'result': str(calc.result),
-                'timestamp': calc.timestamp
-            })
-        return pd.DataFrame(history_data)
+        self._sync_hist_cols()
+        if not self.history:
+            df = pd.DataFrame(self._hist_cols, copy=False)
+        else:
+            # pyarrow's columnar builder assembles the table in C++ and
+            # skips pandas' per-cell object boxing
+            df = pa.Table.from_pydict(self._hist_cols).to_pandas()
+        # The buffer stores ISO strings; callers expect real datetimes
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+        return df
 
     def show_history(self) -> List[str]:
         """Get formatted history of calculations."""
@@ -218,6 +406,8 @@ class Calculator:
     def clear_history(self) -> None:
         """Clear calculation history."""
         self.history.clear()
+        self._rebuild_hist_buffers()
+        self._history_file_dirty = True
         self.undo_stack.clear()
         self.redo_stack.clear()
         logging.info("History cleared")
@@ -229,6 +419,10 @@ class Calculator:
         memento = self.undo_stack.pop()
         self.redo_stack.append(CalculatorMemento(self.history.copy()))
         self.history = memento.history.copy()
+        # At the deque cap a snapshot can match the live history in
+        # length, so the length-based sync would miss the swap
+        self._rebuild_hist_buffers()
+        self._history_file_dirty = True
         return True
 
     def redo(self) -> bool:
@@ -238,6 +432,8 @@ class Calculator:
         memento = self.redo_stack.pop()
         self.undo_stack.append(CalculatorMemento(self.history.copy()))
         self.history = memento.history.copy()
+        self._rebuild_hist_buffers()
+        self._history_file_dirty = True
         return True
 
 def calculator_repl(): # pragma: no cover
@@ -1,5 +1,7 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import Context, Decimal, localcontext
+from functools import cached_property
 from numbers import Number
 from pathlib import Path
 import os
@@ -11,6 +13,10 @@ from app.exceptions import ConfigurationError
 # Load .env variables
 load_dotenv()
 
+# Exact truthy spellings for boolean env flags; set membership replaces a
+# per-read .lower() allocation plus chained compares
+_TRUTHY = frozenset({'1', 'true', 'True', 'TRUE'})
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     # Get the directory of the current file 
@@ -29,69 +35,96 @@ class CalculatorConfig:
         auto_save: Optional[bool] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
-        default_encoding: Optional[str] = None
+        default_encoding: Optional[str] = None,
+        trust_history: Optional[bool] = None,
+        autosave_batch: Optional[int] = None
     ):
         """Initalizing config wiht .env varibles and/or defaults."""
+        # One snapshot for all config reads, taken at construction; the
+        # lazy path properties below read from it instead of re-querying
+        # the live environment on first access
+        self._env = env = dict(os.environ)
+
         # Set base directory to project root by default
         project_root = get_project_root()
         self.base_dir = base_dir or Path(
-            os.getenv('CALCULATOR_BASE_DIR', str(project_root))
+            env.get('CALCULATOR_BASE_DIR', str(project_root))
         ).resolve()
 
         # Max history size
         self.max_history_size = max_history_size if max_history_size is not None else int(
-            os.getenv('CALCULATOR_MAX_HISTORY_SIZE', '1000')
+            env.get('CALCULATOR_MAX_HISTORY_SIZE', '1000')
         )
 
         # Auto save On/Off
-        auto_save_env = os.getenv('CALCULATOR_AUTO_SAVE', 'true').lower()
         self.auto_save = auto_save if auto_save is not None else (
-            auto_save_env == 'true' or auto_save_env == '1'
+            env.get('CALCULATOR_AUTO_SAVE', 'true') in _TRUTHY
         )
 
         # Precision decimal point
         self.precision = precision if precision is not None else int(
-            os.getenv('CALCULATOR_PRECISION', '10')
+            env.get('CALCULATOR_PRECISION', '10')
         )
 
         # Max input value
         self.max_input_value = max_input_value if max_input_value is not None else Decimal(
-            os.getenv('CALCULATOR_MAX_INPUT_VALUE', '1e999')
+            env.get('CALCULATOR_MAX_INPUT_VALUE', '1e999')
         )
 
         # Default encoding
-        self.default_encoding = default_encoding or os.getenv(
+        self.default_encoding = default_encoding or env.get(
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
-    
+
+        # Operations coalesced per auto-save write
+        self.autosave_batch = autosave_batch if autosave_batch is not None else int(
+            env.get('CALCULATOR_AUTOSAVE_BATCH', '16')
+        )
+
+        # Trust saved history results On/Off (skips re-verification on load)
+        self.trust_history = trust_history if trust_history is not None else (
+            env.get('CALCULATOR_TRUST_HISTORY', 'false') in _TRUTHY
+        )
+
+        # Decimal context cache, built lazily so validate() can still
+        # reject a bad precision first
+        self._decimal_context: Optional[Context] = None
+
     @property
+    def decimal_context(self) -> Context:
+        """Get the Decimal context sized to the configured precision."""
+        if self._decimal_context is None:
+            self._decimal_context = Context(prec=self.precision)
+        return self._decimal_context
+
+    @cached_property
     def log_dir(self) -> Path: # Log File Output directory
         """Get log directory path."""
-        return Path(os.getenv(
+        return Path(self._env.get(
             'CALCULATOR_LOG_DIR',
             str(self.base_dir / "logs")
         )).resolve()
 
-    @property
+    @cached_property
     def history_dir(self) -> Path: # History directory location
         """Get history directory path."""
-        return Path(os.getenv(
+        return Path(self._env.get(
             'CALCULATOR_HISTORY_DIR',
             str(self.base_dir / "history")
         )).resolve()
 
-    @property
+    @cached_property
     def history_file(self) -> Path: # History file location
         """Get history file path."""
-        return Path(os.getenv(
+        return Path(self._env.get(
             'CALCULATOR_HISTORY_FILE',
-            str(self.history_dir / "calculator_history.csv")
+            str(self.history_dir / "calculator_history.parquet")
         )).resolve()
 
-    @property
+    @cached_property
     def log_file(self) -> Path: # Log File locaation
         """Get log file path."""
-        return Path(os.getenv(
+        return Path(self._env.get(
             'CALCULATOR_LOG_FILE',
             str(self.log_dir / "calculator.log")
         )).resolve()
@@ -104,4 +137,14 @@ class CalculatorConfig:
             raise ConfigurationError("precision must be positive")
         if self.max_input_value <= 0:
             raise ConfigurationError("max_input_value must be positive")
-        
\ No newline at end of file
+
+@contextmanager
+def use_config_context(config: CalculatorConfig):
+    """
+    Run a batch of Decimal operations under the config's cached context.
+
+    Entering the thread-local Decimal context once per batch avoids
+    re-entering it for every single operation.
+    """
+    with localcontext(config.decimal_context) as ctx:
+        yield ctx
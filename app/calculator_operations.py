@@ -5,75 +5,258 @@ Defines the CalculatorOperations class, which represents a single calculation op
 performs the calculation, and provides methods for serialization and deserialization.
 """
 
-from dataclasses import dataclass, field
 import datetime # Document accurate time
 from decimal import Decimal, InvalidOperation
+from enum import IntEnum
+from functools import lru_cache
 import logging # For logging purposes
-from typing import Any, Dict
+import orjson # C-level JSON, serializes straight to bytes
+import sys
+import time
+from typing import Any, Dict, Optional
 
+from app._fastops import pow_decimal, root_decimal
 from app.exceptions import OperationError
 
-@dataclass
+"""Error Handling, LBYL"""
+def _raise_div_zero():
+    """Helper function to raise divide by zero error."""
+    raise OperationError("Division by zero is not allowed")
+
+def _raise_neg_power():
+    """Helper function to raise negative power error."""
+    raise OperationError("Negative exponents are not supported")
+
+def _raise_invalid_root(x: Decimal, y: Decimal):
+    """Helper function to raise invalid root error."""
+    if y == 0: # specifying errors and giving appropriate response
+        raise OperationError("Zero root is undefined")
+    if x < 0:
+        raise OperationError("Cannot calculate root of negative number")
+    raise OperationError("Invalid root operation")
+
+def _compile_op(name: str, source: str):
+    """Compile one specialized straight-line operation at import time."""
+    # Runtime code-gen keeps each variant free of dispatch and try frames;
+    # the generated functions close over nothing but the raise helpers
+    namespace = {'_raise_div_zero': _raise_div_zero}
+    exec(compile(source, f'<calculator op {name}>', 'exec'), namespace) # pylint: disable=exec-used
+    return namespace[name]
+
+_add = _compile_op('_add', 'def _add(x, y):\n    return x + y')
+_sub = _compile_op('_sub', 'def _sub(x, y):\n    return x - y')
+_mul = _compile_op('_mul', 'def _mul(x, y):\n    return x * y')
+_div = _compile_op(
+    '_div',
+    'def _div(x, y):\n'
+    '    if y == 0:\n'
+    '        _raise_div_zero()\n'
+    '    return x / y'
+)
+
+def _pow(x, y):
+    """Raise x to the power y, rejecting negative exponents."""
+    if y < 0:
+        _raise_neg_power()
+    return pow_decimal(x, y)
+
+def _root(x, y):
+    """Take the y-th root of x, rejecting invalid inputs."""
+    if x < 0 or y == 0:
+        _raise_invalid_root(x, y)
+    return root_decimal(x, y)
+
+def _parse_timestamp(value: Any) -> datetime.datetime:
+    """Parse a saved timestamp, fast-pathing the fixed layout this app writes."""
+    if isinstance(value, datetime.datetime): # Already parsed (e.g. pandas)
+        return value
+    # to_dict always emits 'YYYY-MM-DDTHH:MM:SS.ffffff' (26 chars); slicing at
+    # fixed offsets skips fromisoformat's format autodetection branches
+    if len(value) == 26 and value[4] == '-' and value[10] == 'T':
+        try:
+            return datetime.datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                int(value[20:26])
+            )
+        except ValueError: # EAFP, unexpected layout falls through
+            pass
+    return datetime.datetime.fromisoformat(value)
+
+@lru_cache(maxsize=32)
+def _quant(precision: int) -> Decimal:
+    """Get the cached quantize template for a precision."""
+    # Construct-from-tuple skips the Decimal string parser entirely;
+    # non-positive precisions quantize to a whole number like before
+    if precision > 0:
+        return Decimal((0, (1,), -precision))
+    return Decimal(1)
+
+class OpCode(IntEnum):
+    """Small integer tags for the supported operations."""
+    ADD = 0
+    SUB = 1
+    MUL = 2
+    DIV = 3
+    POW = 4
+    ROOT = 5
+
+# Dispatch tables built once at import, avoids rebuilding per calculate() call.
+# The tuple is indexed by OpCode so the hot path is a C-level item load
+# instead of a string hash + compare.
+_OP_FUNCS = (_add, _sub, _mul, _div, _pow, _root)
+_NAME_TO_CODE: Dict[str, OpCode] = {
+    "Addition": OpCode.ADD,
+    "Subtraction": OpCode.SUB,
+    "Multiplication": OpCode.MUL,
+    "Division": OpCode.DIV,
+    "Power": OpCode.POW,
+    "Root": OpCode.ROOT
+}
+_COMMUTATIVE_CODES = (OpCode.ADD, OpCode.MUL)
+
+# One interned string object per operation name; every history entry then
+# shares the same heap object and name comparisons are pointer checks
+_OP_INTERN: Dict[str, str] = {name: sys.intern(name) for name in _NAME_TO_CODE}
+
+def _intern_op(operation: Any) -> Any:
+    """Map an operation name to its single shared string object."""
+    cached = _OP_INTERN.get(operation)
+    if cached is not None:
+        return cached
+    return sys.intern(operation) if type(operation) is str else operation
+
+# Machine-int fast path bounds: operands must be exactly representable
+# and results must stay inside any sane Decimal context precision so the
+# exact int arithmetic can never disagree with the Decimal path
+_INT_OPERAND_MAX = 2 ** 53
+_INT_RESULT_MAX = 10 ** 9
+
+def _int_or_none(value: Decimal):
+    """Return value as a machine int when it is integral and small, else None."""
+    try:
+        as_int = int(value)
+    except (ValueError, OverflowError): # NaN / Infinity
+        return None
+    if as_int == value and -_INT_OPERAND_MAX < as_int < _INT_OPERAND_MAX:
+        return as_int
+    return None
+
+def _int_fast(code: int, x: int, y: int):
+    """Try the operation in native int arithmetic; None means fall back."""
+    if code == OpCode.ADD:
+        result = x + y
+    elif code == OpCode.SUB:
+        result = x - y
+    elif code == OpCode.MUL:
+        result = x * y
+    elif code == OpCode.DIV and y != 0 and x % y == 0:
+        result = x // y
+    else: # Inexact division, power and root keep the Decimal path
+        return None
+    if -_INT_RESULT_MAX < result < _INT_RESULT_MAX:
+        return Decimal(result)
+    return None
+
+# Memoization of results across identical operation/operand triples, so
+# replays become a hash lookup instead of arithmetic. Only exact results
+# from the int fast path are stored: Decimal results depend on the active
+# context's precision/rounding and must never be served across contexts
+_OP_MEMO: Dict[tuple, Decimal] = {}
+_OP_MEMO_MAX = 1024 # Bound the cache so long sessions cannot grow it forever
+
 class CalculatorOperations:
     """Object representing a single operation."""
-    
-    # Required fields
-    operation: str
-    operand1: Decimal
-    operand2: Decimal
 
-    # End field with default value
-    result: Decimal = field(init=False)
-    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
+    # Fixed slots drop the per-instance __dict__, shrinking each history
+    # entry and making attribute access a C-level descriptor load. The
+    # timestamp is stored privately so it can be filled in lazily.
+    __slots__ = ('operation', 'operand1', 'operand2', 'result',
+                 '_timestamp', '_code', '_impl', '_str_cache', '_dict_cache',
+                 '_fmt_cache')
+
+    def __init__(
+        self,
+        operation: str,
+        operand1: Decimal,
+        operand2: Decimal,
+        result: Optional[Decimal] = None,
+        timestamp: Optional[datetime.datetime] = None
+    ):
+        """Initialize the operation fields and compute the result."""
+        self.operation = _intern_op(operation)
+        self.operand1 = operand1
+        self.operand2 = operand2
+        # Specialized implementation resolved once; calculate() calls it directly
+        self._code = _NAME_TO_CODE.get(operation)
+        if self._code is None and result is not None:
+            # With a supplied result calculate() never runs to reject the
+            # name, so malformed history rows must fail loudly here
+            raise OperationError(f"Unknown Operation: {operation}") # LBYL
+        self._impl = _OP_FUNCS[self._code] if self._code is not None else None
+        # time.time() is a bare clock read; building the datetime (and any
+        # ISO formatting) is deferred until the timestamp is actually used
+        self._timestamp = time.time() if timestamp is None else timestamp
+        # Lazy per-instance caches; safe because operands/result never mutate
+        self._str_cache = None
+        self._dict_cache = None
+        self._fmt_cache: Dict[int, str] = {}
+        # A caller supplying the result (deserialization) skips the
+        # arithmetic entirely; fresh operations still compute it
+        self.result = result if result is not None else self.calculate()
 
-    def __post_init__(self):
-        """Calculation post initalization"""
-        self.result = self.calculate()
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Get the operation timestamp, converted lazily on first access."""
+        ts = self._timestamp
+        if type(ts) is float: # Raw epoch stamp from __init__
+            ts = self._timestamp = datetime.datetime.fromtimestamp(ts)
+        elif ts is None:
+            ts = self._timestamp = datetime.datetime.now()
+        return ts
+
+    @timestamp.setter
+    def timestamp(self, value: datetime.datetime) -> None:
+        """Set the operation timestamp (used when loading saved history)."""
+        self._timestamp = value
 
     def calculate(self):
         """Main Calculation class, preforms appropriate operation based on dictionary vallidating inputs"""
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1/float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            )
-        }
-
-        OP = operations.get(self.operation)
-        if not OP:
+        code = self._code
+        if code is None:
             raise OperationError(f"Unknown Operation: {self.operation}") # LBYL
-        
+
+        # Commutative operations share one cache entry per unordered pair
+        if code in _COMMUTATIVE_CODES and self.operand2 < self.operand1:
+            key = (code, self.operand2, self.operand1)
+        else:
+            key = (code, self.operand1, self.operand2)
+        result = _OP_MEMO.get(key)
+        if result is not None:
+            return result
+
+        # Small integral operands (the overwhelmingly common case) run in
+        # native int arithmetic, which is exact and skips Decimal context
+        # handling entirely
+        if code <= OpCode.DIV:
+            x = _int_or_none(self.operand1)
+            if x is not None:
+                y = _int_or_none(self.operand2)
+                if y is not None:
+                    result = _int_fast(code, x, y)
+                    if result is not None:
+                        if len(_OP_MEMO) >= _OP_MEMO_MAX:
+                            _OP_MEMO.clear()
+                        _OP_MEMO[key] = result
+                        return result
+
+        # Context-sensitive Decimal results are computed fresh every time;
+        # caching them would replay one context's rounding under another
         try:
-            return OP(self.operand1, self.operand2)
+            return self._impl(self.operand1, self.operand2)
         except (InvalidOperation, ValueError, ArithmeticError) as e:
             raise OperationError(f"Calculation failed: {str(e)}") # EAFP
-        
-    """Error Handling, LBYL"""
-    @staticmethod
-    def _raise_div_zero():
-        """Helper method to raise divide by zero error."""
-        raise OperationError("Division by zero is not allowed")
-
-    @staticmethod
-    def _raise_neg_power():
-        """Helper method to raise negative power error."""
-        raise OperationError("Negative exponents are not supported")
 
-    @staticmethod
-    def _raise_invalid_root(x: Decimal, y: Decimal):
-        """Helper method to raise invalid root error."""
-        if y == 0: # specifying errors and giving appropriate response
-            raise OperationError("Zero root is undefined")
-        if x < 0:
-            raise OperationError("Cannot calculate root of negative number")
-        raise OperationError("Invalid root operation")
-    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert calculator operations to dict for serialization. For logging
@@ -81,14 +264,196 @@ class CalculatorOperations:
         Returns:
             Dict containing the calculator operation data in serializable format
         """
-        return {
-            'operation': self.operation,
-            'operand1': str(self.operand1),
-            'operand2': str(self.operand2),
-            'result': str(self.result),
-            'timestamp': self.timestamp.isoformat()
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'operation': self.operation,
+                'operand1': str(self.operand1),
+                'operand2': str(self.operand2),
+                'result': str(self.result),
+                'timestamp': self.timestamp.isoformat()
+            }
+        # Shallow copy keeps callers from mutating the cached dict
+        return dict(self._dict_cache)
     
+    @classmethod
+    def _from_parts(
+        cls,
+        operation: str,
+        operand1: Decimal,
+        operand2: Decimal,
+        result: Decimal,
+        timestamp: Optional[datetime.datetime]
+    ) -> 'CalculatorOperations':
+        """Build an instance from already-validated parts, skipping recompute."""
+        calc = object.__new__(cls)
+        calc.operation = _intern_op(operation)
+        calc.operand1 = operand1
+        calc.operand2 = operand2
+        calc._code = _NAME_TO_CODE.get(operation) # pylint: disable=protected-access
+        if calc._code is None:
+            raise OperationError(f"Unknown Operation: {operation}") # LBYL
+        calc._impl = _OP_FUNCS[calc._code]
+        calc._timestamp = timestamp
+        calc._str_cache = None
+        calc._dict_cache = None
+        calc._fmt_cache = {}
+        calc.result = result
+        return calc
+
+    @classmethod
+    def from_records(
+        cls,
+        rows,
+        trust_results: bool = False,
+        verify: bool = False
+    ) -> list:
+        """
+        Batch-construct operations from an iterable of history rows.
+
+        Arguments:
+            rows: Iterable of dicts shaped like to_dict() output
+            trust_results: Reuse each stored result instead of recomputing it
+            verify: With trusted results, run the float64 bulk verifier and
+                recompute only the flagged entries on the exact Decimal path
+
+        Returns:
+            List of calculatorOperations instances
+
+        Raises:
+            OperationError: If any row is invalid or missing required fields
+        """
+        try:
+            parsed = [
+                (
+                    data['operation'],
+                    Decimal(data['operand1']),
+                    Decimal(data['operand2']),
+                    Decimal(data['result']),
+                    _parse_timestamp(data['timestamp'])
+                )
+                for data in rows
+            ]
+        except (KeyError, InvalidOperation, ValueError, TypeError) as e:
+            raise OperationError(f"Invalid calculation data: {str(e)}")
+        return cls._from_parsed(parsed, trust_results, verify)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df,
+        trust_results: bool = False,
+        verify: bool = False
+    ) -> list:
+        """
+        Batch-construct operations straight from a history DataFrame.
+
+        Column-wise conversion (Series.map is Cython-backed) avoids the
+        per-row dict building that df.to_dict('records') + from_records
+        would do; the trust/verify semantics match from_records.
+
+        Arguments:
+            df: DataFrame with the to_dict() columns
+            trust_results: Reuse each stored result instead of recomputing it
+            verify: With trusted results, bulk-verify and recompute flagged rows
+
+        Returns:
+            List of calculatorOperations instances
+
+        Raises:
+            OperationError: If any column is missing or a value is invalid
+        """
+        try:
+            parsed = list(zip(
+                df['operation'].tolist(),
+                df['operand1'].map(Decimal).tolist(),
+                df['operand2'].map(Decimal).tolist(),
+                df['result'].map(Decimal).tolist(),
+                df['timestamp'].map(_parse_timestamp).tolist()
+            ))
+        except (KeyError, InvalidOperation, ValueError, TypeError) as e:
+            raise OperationError(f"Invalid calculation data: {str(e)}")
+        return cls._from_parsed(parsed, trust_results, verify)
+
+    @classmethod
+    def _from_parsed(cls, parsed: list, trust_results: bool, verify: bool) -> list:
+        """Build instances from parsed (op, a, b, result, timestamp) tuples."""
+        if not trust_results and not verify:
+            # Full per-row recompute, same semantics as from_dict
+            calcs = []
+            for operation, operand1, operand2, saved_result, timestamp in parsed:
+                calc = cls(operation, operand1, operand2, timestamp=timestamp)
+                if calc.result != saved_result:
+                    logging.warning(
+                        f"Loaded calculation result {saved_result} "
+                        f"Different from computed result {calc.result}"
+                    )
+                calcs.append(calc)
+            return calcs
+
+        calcs = [cls._from_parts(*parts) for parts in parsed]
+        if verify:
+            # Local imports keep the observer module from importing eagerly
+            import numpy as np # pylint: disable=import-outside-toplevel
+            from app.history import BULK_OP_CODES, bulk_verify # pylint: disable=import-outside-toplevel,cyclic-import
+            codes = np.array(
+                [BULK_OP_CODES.get(parts[0], -1) for parts in parsed],
+                dtype=np.int8
+            )
+            a = np.array([float(parts[1]) for parts in parsed])
+            b = np.array([float(parts[2]) for parts in parsed])
+            r = np.array([float(parts[3]) for parts in parsed])
+            for i, ok in enumerate(bulk_verify(codes, a, b, r)):
+                if not ok: # Fall back to the exact Decimal path per flagged row
+                    operation, operand1, operand2, saved_result, timestamp = parsed[i]
+                    calc = cls(operation, operand1, operand2, timestamp=timestamp)
+                    if calc.result != saved_result:
+                        logging.warning(
+                            f"Loaded calculation result {saved_result} "
+                            f"Different from computed result {calc.result}"
+                        )
+                    calcs[i] = calc
+        return calcs
+
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> 'CalculatorOperations':
+        """
+        Create calculation operation from dictionary, trusting the saved result.
+
+        Skips the re-calculate that from_dict performs, halving the Decimal
+        arithmetic when replaying a history this process wrote itself.
+
+        Arguments:
+            data: Dictionary containing calculator operation data
+
+        Returns:
+            New calculatorOperations instance
+
+        Raises:
+            OperationError: If data is invalid or missing required fields
+        """
+        try:
+            return cls._from_parts(
+                data['operation'],
+                Decimal(data['operand1']),
+                Decimal(data['operand2']),
+                Decimal(data['result']),
+                _parse_timestamp(data['timestamp'])
+            )
+        except (KeyError, InvalidOperation, ValueError, TypeError) as e:
+            raise OperationError(f"Invalid calculation data: {str(e)}")
+
+    def to_json(self) -> bytes:
+        """Serialize the operation to one compact JSON document (bytes)."""
+        return orjson.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'CalculatorOperations':
+        """Create a calculation operation from a to_json() document."""
+        try:
+            return cls.from_dict(orjson.loads(raw))
+        except orjson.JSONDecodeError as e:
+            raise OperationError(f"Invalid calculation data: {str(e)}")
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'CalculatorOperations':
         """
@@ -104,26 +469,16 @@ class CalculatorOperations:
             OperationError: If data is invalid or missing required fields
         """
         try:
-            # Create the calculatorOperations object with the original operands
-            calc = CalculatorOperations(
+            # Passing the saved result skips re-running the arithmetic;
+            # the KeyError on a missing field still maps to OperationError
+            return CalculatorOperations(
                 operation=data['operation'],
                 operand1=Decimal(data['operand1']),
-                operand2=Decimal(data['operand2'])
+                operand2=Decimal(data['operand2']),
+                result=Decimal(data['result']),
+                timestamp=_parse_timestamp(data['timestamp'])
             )
-        
-            # set timestamp from saved data
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
-
-            # Data verification, checking for data mismatch
-            saved_result = Decimal(data['result'])
-            if calc.result != saved_result:
-                logging.warning(
-                    f"Loaded calculation result {saved_result} "
-                    f"Different from computed result {calc.result}"
-                )
-        
-            return calc
-    
+
         except (KeyError, InvalidOperation, ValueError) as e:
             raise OperationError(f"Invalid calculation data: {str(e)}")
 
@@ -134,7 +489,11 @@ class CalculatorOperations:
         Returns:
             Formatted string showing the calculation and output.
         """
-        return f"{self.operation}({self.operand1}, {self.operand2}) = {self.result}"
+        if self._str_cache is None:
+            self._str_cache = (
+                f"{self.operation}({self.operand1}, {self.operand2}) = {self.result}"
+            )
+        return self._str_cache
     
     def __repr__(self) -> str:
         """
@@ -170,6 +529,18 @@ class CalculatorOperations:
             self.result == other.result
         )
     
+    def __hash__(self) -> int:
+        """
+        Hash on the fields that identify a calculation.
+
+        Defining __eq__ alone disables inherited hashing, which blocked
+        set/dict membership and any dedup of replayed operations. An
+        instance never mutates its operands after construction, so the
+        (operation, operand1, operand2) triple is a stable key; equal
+        instances hash equally because the result derives from it.
+        """
+        return hash((self.operation, self.operand1, self.operand2))
+
     def format_result(self, precision: int = 10) -> str:
         """
         Format the output with specific precision.
@@ -180,10 +551,14 @@ class CalculatorOperations:
         Returns:
             Formatted string with number showing decimal places specified
         """
+        cached = self._fmt_cache.get(precision)
+        if cached is not None: # show_history reformats the same results
+            return cached
         try:
-            # Remove trailing zeros and format to specified precision
-            return str(self.result.normalize().quantize(
-                Decimal('0.' + '0' * precision)
-            ).normalize())
+            # Quantize sets the exponent explicitly, so only the trailing
+            # zero strip after it is needed
+            formatted = str(self.result.quantize(_quant(precision)).normalize())
         except InvalidOperation: # EAFP
-            return str(self.result)
+            formatted = str(self.result)
+        self._fmt_cache[precision] = formatted
+        return formatted
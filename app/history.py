@@ -1,8 +1,95 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Any
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+try: # Numba is optional; the vectorized NumPy fallback below keeps behavior identical
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError: # pragma: no cover
+    _HAS_NUMBA = False
+
 from app.calculator_operations import CalculatorOperations
 
+# Module-level logger; %s-style args defer formatting until a handler consumes it
+_log = logging.getLogger(__name__)
+
+# Integer codes for encoding operation names once per batch (order is fixed)
+BULK_OP_CODES = {
+    'Addition': 0,
+    'Subtraction': 1,
+    'Multiplication': 2,
+    'Division': 3,
+    'Power': 4,
+    'Root': 5
+}
+
+def _verify_elementwise(code: int, x: float, y: float) -> float:
+    """Recompute one float64 operation for verification (jitted when possible)."""
+    if code == 0:
+        return x + y
+    if code == 1:
+        return x - y
+    if code == 2:
+        return x * y
+    if code == 3:
+        return x / y if y != 0.0 else np.nan
+    if code == 4:
+        return x ** y
+    if code == 5:
+        return x ** (1.0 / y) if y != 0.0 else np.nan
+    return np.nan
+
+if _HAS_NUMBA:
+    _verify_elementwise = njit(cache=True)(_verify_elementwise)
+
+    @njit(cache=True, parallel=True)
+    def _bulk_verify_kernel(ops, a, b, r, rtol): # pragma: no cover - machine code path
+        out = np.empty(ops.shape[0], dtype=np.bool_)
+        for i in prange(ops.shape[0]): # pylint: disable=not-an-iterable
+            expected = _verify_elementwise(ops[i], a[i], b[i])
+            tol = rtol * max(abs(expected), abs(r[i]), 1.0)
+            out[i] = abs(expected - r[i]) <= tol
+        return out
+else:
+    def _bulk_verify_kernel(ops, a, b, r, rtol):
+        out = np.empty(ops.shape[0], dtype=np.bool_)
+        for i in range(ops.shape[0]):
+            expected = _verify_elementwise(ops[i], a[i], b[i])
+            tol = rtol * max(abs(expected), abs(r[i]), 1.0)
+            out[i] = abs(expected - r[i]) <= tol
+        return out
+
+def bulk_verify(
+    ops: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    r: np.ndarray,
+    rtol: float = 1e-9
+) -> np.ndarray:
+    """
+    Verify a whole batch of saved results in one machine-code loop.
+
+    Args:
+        ops: int8 operation codes (see BULK_OP_CODES)
+        a: float64 first operands
+        b: float64 second operands
+        r: float64 saved results
+        rtol: relative tolerance for the float64 comparison
+
+    Returns:
+        Boolean array; False entries should be re-checked on the Decimal path
+    """
+    return _bulk_verify_kernel(
+        np.ascontiguousarray(ops, dtype=np.int8),
+        np.ascontiguousarray(a, dtype=np.float64),
+        np.ascontiguousarray(b, dtype=np.float64),
+        np.ascontiguousarray(r, dtype=np.float64),
+        rtol
+    )
+
 class HistoryObserver(ABC):
     """Abstract class for calculator observers."""
     
@@ -23,24 +110,65 @@ class LoggingObserver(HistoryObserver):
         """Log calculation details."""
         if calculatorOperations is None:
             raise AttributeError("Operation cannot be None")
-        logging.info(
-            f"Calculation performed: {calculatorOperations.operation} "
-            f"({calculatorOperations.operand1}, {calculatorOperations.operand2}) = "
-            f"{calculatorOperations.result}"
+        if not _log.isEnabledFor(logging.INFO): # Skip Decimal formatting entirely
+            return
+        _log.info(
+            "Calculation performed: %s (%s, %s) = %s",
+            calculatorOperations.operation,
+            calculatorOperations.operand1,
+            calculatorOperations.operand2,
+            calculatorOperations.result
         )
 
 class AutoSaveObserver(HistoryObserver):
-    """Observer that automatically saves calculations."""
-    
-    def __init__(self, calculator: Any):
+    """Observer that automatically saves calculations, debounced.
+
+    Saving on every single operation rewrites the whole history file per
+    op (O(N^2) over a session). Saves are coalesced: one write per
+    save_every operations, or on the first operation after save_interval
+    seconds of quiet. flush() forces any pending write, e.g. at shutdown.
+    """
+
+    def __init__(
+        self,
+        calculator: Any,
+        save_every: Optional[int] = None,
+        save_interval: float = 0.25
+    ):
         if not hasattr(calculator, 'config') or not hasattr(calculator, 'save_history'):
             raise TypeError("Calculator must have 'config' and 'save_history' attributes")
         self.calculator = calculator
+        if save_every is None:
+            # Pull the batch size from the config knob when present; the
+            # isinstance check keeps Mock configs on the default
+            batch = getattr(calculator.config, 'autosave_batch', None)
+            save_every = batch if isinstance(batch, int) else 16
+        self.save_every = max(1, int(save_every))
+        self.save_interval = save_interval
+        self._pending = 0
+        self._last_save = time.monotonic()
 
     def update(self, calculatorOperations: CalculatorOperations) -> None:
-        """Trigger auto-save."""
+        """Trigger auto-save once enough operations or time accumulated."""
         if calculatorOperations is None:
             raise AttributeError("Operation cannot be None")
-        if self.calculator.config.auto_save:
-            self.calculator.save_history()
-            logging.info("History auto-saved")
\ No newline at end of file
+        if not self.calculator.config.auto_save:
+            return
+        appender = getattr(self.calculator, '_append_history_row', None)
+        if appender is not None and appender(calculatorOperations):
+            # O(1) incremental append kept the file current; formats with
+            # no row-append return False and take the batched path below
+            return
+        self._pending += 1
+        if (self._pending >= self.save_every
+                or time.monotonic() - self._last_save > self.save_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any pending history immediately."""
+        if self._pending == 0:
+            return
+        self.calculator.save_history()
+        self._pending = 0
+        self._last_save = time.monotonic()
+        _log.info("History auto-saved")
\ No newline at end of file
@@ -1,9 +1,26 @@
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+import re
 from typing import Any
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
+# Accepts plain and scientific notation; rejecting bad input on a regex
+# match is far cheaper than constructing Decimal just to catch its raise
+_NUM_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Infinity spellings skip the regex so they still reach the max-value
+# check; Decimal accepts them in any case, so the gate must too
+_INF_NAMES = frozenset({'inf', 'infinity'})
+
+@lru_cache(maxsize=2048)
+def _parse_decimal(raw: str) -> Decimal:
+    """Parse a numeric string, caching repeats of the same literal."""
+    # Decimal is immutable, so handing the same object back is safe; the
+    # REPL re-enters the same small numbers constantly
+    return Decimal(raw)
+
 @dataclass
 class InputValidator:
     """Validates and sanitizes calculator inputs."""
@@ -26,9 +43,16 @@ class InputValidator:
         try:
             if isinstance(value, str):
                 value = value.strip()
-            number = Decimal(str(value))
-            if abs(number) > config.max_input_value:
-                raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
+            raw = str(value)
+            if (_NUM_RE.fullmatch(raw) is None
+                    and raw.lstrip('+-').lower() not in _INF_NAMES): # LBYL
+                raise ValidationError(f"Invalid number format: {value}")
+            number = _parse_decimal(raw)
+            # Hoist the limit to a local and use the C-level copy_abs,
+            # skipping abs()'s __abs__ dispatch on the hot path
+            max_value = config.max_input_value
+            if number.copy_abs() > max_value:
+                raise ValidationError(f"Value exceeds maximum allowed: {max_value}")
             return number.normalize()
         except InvalidOperation as e:
             raise ValidationError(f"Invalid number format: {value}") from e
\ No newline at end of file
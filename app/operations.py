@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict
+from app._fastops import pow_decimal, root_decimal
+from app.calculator_operations import OpCode
 from app.exceptions import ValidationError
 
 
@@ -47,7 +49,6 @@ class Addition(Operation): # Polymorphism (Operation)
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal: # Inheritance, execute method from the operation class
         """Adding both inputs"""
-        self.validate_operands(a, b) # Encapsulation, validation is immuatable and done through a method
         return a + b
     
 class Subtraction(Operation):
@@ -55,7 +56,6 @@ class Subtraction(Operation):
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """Subtracting b from a"""
-        self.validate_operands(a, b)
         return a - b
 
 class Multiplication(Operation):
@@ -63,7 +63,6 @@ class Multiplication(Operation):
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """Multiplying both inputs together"""
-        self.validate_operands(a, b)
         return a * b
     
 class Division(Operation):
@@ -92,7 +91,7 @@ class Power(Operation):
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """Calculate a number, a, raised to the power b."""
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b))) # Type casting
+        return pow_decimal(a, b)
 
 class Root(Operation):
     """Root Function"""
@@ -107,7 +106,7 @@ class Root(Operation):
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1/float(b)))
+        return root_decimal(a, b)
 
 # Factory Method
 class OperationFactory:
@@ -121,6 +120,28 @@ class OperationFactory:
         'root': Root
     }
 
+    # Parallel table indexed by OpCode for the fastest lookup path:
+    # a tuple index instead of a string lower() + dict probe
+    _operations_by_code = (Addition, Subtraction, Multiplication, Division, Power, Root)
+
+    @classmethod
+    def create_by_code(cls, code: OpCode) -> Operation:
+        """
+        Create operation instance directly from its integer tag
+
+        Arguments:
+            code: OpCode of the operation to create
+
+        Returns:
+            Operation Instance
+
+        Raises:
+            ValueError: If the code does not map to an operation
+        """
+        if not 0 <= code < len(cls._operations_by_code): # LBYL
+            raise ValueError(f"Unknown operation code: {code}")
+        return cls._operations_by_code[code]()
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
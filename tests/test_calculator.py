@@ -2,15 +2,16 @@
 Unit tests for the Calculator class.
 """
 
+from collections import deque
 import datetime
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pandas as pd
 import pytest
 
-from app.calculator import Calculator
+from app.calculator import Calculator, _HIST_DTYPES
 from app.calculator_config import CalculatorConfig
 from app.calculator_operations import CalculatorOperations
 from app.exceptions import OperationError, ValidationError
@@ -42,11 +43,11 @@ def test_calculator_initialization():
          patch.object(Calculator, 'save_history'):
         calc = Calculator()
     assert calc.config is not None
-    assert isinstance(calc.history, list)
+    assert isinstance(calc.history, deque)
     assert calc.operation_strategy is None
     assert isinstance(calc.observers, list)
-    assert isinstance(calc.undo_stack, list)
-    assert isinstance(calc.redo_stack, list)
+    assert isinstance(calc.undo_stack, deque)
+    assert isinstance(calc.redo_stack, deque)
 
 
 def test_set_operation(calculator):
@@ -114,9 +115,9 @@ def test_save_history(calculator):
     calculator.history.append(
         CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
     )
-    with patch('pandas.DataFrame.to_csv') as mock_to_csv:
+    with patch('pandas.DataFrame.to_parquet') as mock_to_parquet:
         calculator.save_history()
-        mock_to_csv.assert_called_once()
+        mock_to_parquet.assert_called_once()
 
 
 def test_load_history(calculator):
@@ -129,7 +130,7 @@ def test_load_history(calculator):
         'timestamp': datetime.datetime.now().isoformat()
     }])
     with patch('app.calculator.Path.exists', return_value=True), \
-        patch('pandas.read_csv', return_value=data):
+        patch('pandas.read_parquet', return_value=data):
         calculator.load_history()
         assert len(calculator.history) == 1
         calc_op = calculator.history[0]
@@ -139,6 +140,107 @@ def test_load_history(calculator):
         assert calc_op.result == Decimal('5')
 
 
+def test_save_history_csv_writes_buffer(calculator, tmp_path):
+    """Test that legacy CSV saves write the pre-serialized buffer in one shot."""
+    calculator.config.history_file = tmp_path / 'legacy.csv'
+    operation = Addition()
+    calculator.set_operation(operation)
+    calculator.perform_operation('2', '3')
+    calculator.save_history()
+    lines = (tmp_path / 'legacy.csv').read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'operation,operand1,operand2,result,timestamp'
+    assert lines[1].startswith('Addition,2,3,5,')
+
+
+def test_load_history_round_trip_is_idempotent(calculator, tmp_path):
+    """Test that an untrusted reload reproduces inexact results exactly."""
+    calculator.config.history_file = tmp_path / 'history.csv'
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    calculator.perform_operation('1', '3')
+    saved_result = calculator.history[0].result
+    calculator.save_history()
+    calculator.clear_history()
+    calculator.load_history()
+    assert calculator.history[0].result == saved_result
+
+
+def test_load_history_refreshes_buffers(calculator, tmp_path):
+    """Test that loading replaces the save buffers even at equal length."""
+    calculator.config.history_file = tmp_path / 'history.csv'
+    operation = Addition()
+    calculator.set_operation(operation)
+    calculator.perform_operation('1', '2')
+    calculator.save_history()
+    calculator.clear_history()
+    calculator.perform_operation('7', '8') # Same length as the saved file
+    calculator.load_history()
+    calculator.save_history()
+    lines = (tmp_path / 'history.csv').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith('Addition,1,2,3,') # Not the replaced 7+8 row
+
+
+def test_append_history_row_rewrites_after_undo(calculator, tmp_path):
+    """Test that appends after an undo rewrite the file instead of drifting."""
+    calculator.config.history_file = tmp_path / 'history.csv'
+    operation = Addition()
+    calculator.set_operation(operation)
+    calculator.perform_operation('2', '3')
+    assert calculator._append_history_row(calculator.history[-1]) is True # pylint: disable=protected-access
+    calculator.undo()
+    calculator.perform_operation('4', '4')
+    assert calculator._append_history_row(calculator.history[-1]) is True # pylint: disable=protected-access
+    lines = (tmp_path / 'history.csv').read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'operation,operand1,operand2,result,timestamp'
+    assert len(lines) == 2 # The undone operation must not survive on disk
+    assert lines[1].startswith('Addition,4,4,8,')
+
+
+def test_append_history_row_declines_parquet(calculator):
+    """Test that parquet histories fall back to batched full saves."""
+    calculator.config.history_file = Path('/tmp/calculator_test/history/h.parquet')
+    calc_op = CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
+    with patch.object(calculator, 'save_history') as mock_save:
+        assert calculator._append_history_row(calc_op) is False # pylint: disable=protected-access
+        mock_save.assert_not_called()
+
+
+def test_history_jsonl_round_trip(calculator, tmp_path):
+    """Test saving and loading history through a JSON-lines file."""
+    calculator.config.history_file = tmp_path / 'history.jsonl'
+    operation = Addition()
+    calculator.set_operation(operation)
+    calculator.perform_operation('2', '3')
+    calculator.save_history()
+    calculator.history.clear()
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert calculator.history[0].result == Decimal('5')
+
+
+def test_load_history_csv_passes_schema(calculator):
+    """Test that legacy CSV loads pass an explicit dtype schema to pandas."""
+    calculator.config.history_file = Path('/tmp/calculator_test/history/legacy.csv')
+    data = pd.DataFrame([{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '5',
+        'timestamp': datetime.datetime.now().isoformat()
+    }])
+    with patch('app.calculator.Path.exists', return_value=True), \
+        patch('pandas.read_csv', return_value=data) as mock_read_csv:
+        calculator.load_history()
+        mock_read_csv.assert_called_once_with(
+            ANY,
+            dtype=_HIST_DTYPES,
+            parse_dates=['timestamp'],
+            date_format='ISO8601',
+            engine='c'
+        )
+        assert len(calculator.history) == 1
+
+
 def test_clear_history(calculator):
     """Test clearing history."""
     calculator.history.append(
@@ -189,7 +291,7 @@ def test_redo_without_history(calculator):
 
 def test_get_history_dataframe(calculator):
     """Test getting history as a DataFrame."""
-    calculator.history = []  # Ensure history is empty
+    calculator.history.clear()  # Ensure history is empty
     calculator.history.append(
         CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
     )
@@ -197,11 +299,12 @@ def test_get_history_dataframe(calculator):
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 1
     assert df.iloc[0]['operation'] == 'Addition'
+    assert df['timestamp'].dtype.kind == 'M' # datetime64, not ISO strings
 
 
 def test_show_history(calculator):
     """Test showing history."""
-    calculator.history = []  # Ensure history is empty
+    calculator.history.clear()  # Ensure history is empty
     calculator.history.append(
         CalculatorOperations('Addition', Decimal('2'), Decimal('3'), Decimal('5'))
     )
@@ -213,7 +316,7 @@ def test_show_history(calculator):
 def test_max_history_size(calculator):
     """Test that history does not exceed max history size."""
     calculator.config.max_history_size = 2
-    calculator.history = []  # Ensure history is empty
+    calculator.history.clear()  # Ensure history is empty
     operation = Addition()
     calculator.set_operation(operation)
     calculator.perform_operation('1', '1')
@@ -224,6 +327,33 @@ def test_max_history_size(calculator):
     assert calculator.history[1].operand1 == Decimal('3')
 
 
+def test_history_eviction_at_deque_cap(tmp_path):
+    """Test that eviction at the deque's own maxlen trims buffers and files."""
+    config = CalculatorConfig(
+        base_dir=Path('/tmp/calculator_test'),
+        max_history_size=2,
+        auto_save=False
+    )
+    with patch('app.calculator.logging'), \
+         patch.object(Calculator, 'load_history'), \
+         patch.object(Calculator, 'save_history'):
+        calc = Calculator(config)
+    calc.config.history_file = tmp_path / 'history.csv'
+    operation = Addition()
+    calc.set_operation(operation)
+    calc.perform_operation('1', '1')
+    calc.perform_operation('2', '2')
+    calc.save_history()
+    calc.perform_operation('3', '3') # Evicts 1+1 at the deque cap
+    assert len(calc._hist_cols['operation']) == 2 # pylint: disable=protected-access
+    assert calc._history_file_dirty is True # pylint: disable=protected-access
+    assert calc._append_history_row(calc.history[-1]) is True # pylint: disable=protected-access
+    lines = (tmp_path / 'history.csv').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 3 # Header plus the two surviving rows
+    assert lines[1].startswith('Addition,2,2,4,')
+    assert lines[2].startswith('Addition,3,3,6,')
+
+
 def test_operation_error_handling(calculator):
     """Test that operation errors are handled properly."""
     operation = OperationFactory.create_operation('divide')
@@ -11,6 +11,13 @@ from app.exceptions import ConfigurationError
 from app.calculator_config import CalculatorConfig, get_project_root
 
 
+def test_autosave_batch_from_env(monkeypatch):
+    """Test that CALCULATOR_AUTOSAVE_BATCH controls the auto-save batch size."""
+    monkeypatch.setenv('CALCULATOR_AUTOSAVE_BATCH', '4')
+    config = CalculatorConfig()
+    assert config.autosave_batch == 4
+
+
 def test_default_values(monkeypatch):
     """Test that default values are set correctly when environment variables are not set."""
     # Unset environment variables
@@ -36,7 +43,7 @@ def test_default_values(monkeypatch):
     assert config.log_dir == config.base_dir / "logs"
     assert config.history_dir == config.base_dir / "history"
     assert config.log_file == config.log_dir / "calculator.log"
-    assert config.history_file == config.history_dir / "calculator_history.csv"
+    assert config.history_file == config.history_dir / "calculator_history.parquet"
 
 
 def test_environment_variable_overrides(monkeypatch):
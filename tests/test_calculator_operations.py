@@ -4,6 +4,8 @@ Unit tests for the calculatorOperations.py class.
 
 import datetime
 from decimal import Decimal
+
+import pandas as pd
 import pytest
 
 from app.exceptions import OperationError
@@ -103,6 +105,172 @@ def test_from_dict():
     assert calc.result == Decimal('5')
 
 
+def test_from_dict_unknown_operation():
+    """Test deserialization with an unknown operation name."""
+    data = {
+        'operation': 'Bogus',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '5',
+        'timestamp': datetime.datetime.now().isoformat()
+    }
+    with pytest.raises(OperationError, match="Unknown Operation: Bogus"):
+        CalculatorOperations.from_dict(data)
+
+
+def test_from_dict_trusted_unknown_operation():
+    """Test trusted deserialization with an unknown operation name."""
+    data = {
+        'operation': 'Bogus',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '5',
+        'timestamp': datetime.datetime.now().isoformat()
+    }
+    with pytest.raises(OperationError, match="Unknown Operation: Bogus"):
+        CalculatorOperations.from_dict_trusted(data)
+
+
+def test_from_records():
+    """Test batch deserialization with recompute."""
+    rows = [
+        {
+            'operation': 'Addition',
+            'operand1': '2',
+            'operand2': '3',
+            'result': '5',
+            'timestamp': datetime.datetime.now().isoformat()
+        },
+        {
+            'operation': 'Multiplication',
+            'operand1': '2',
+            'operand2': '4',
+            'result': '8',
+            'timestamp': datetime.datetime.now().isoformat()
+        }
+    ]
+    calcs = CalculatorOperations.from_records(rows)
+    assert len(calcs) == 2
+    assert calcs[0].result == Decimal('5')
+    assert calcs[1].result == Decimal('8')
+
+
+def test_from_dataframe():
+    """Test columnar batch deserialization from a DataFrame."""
+    df = pd.DataFrame([
+        {
+            'operation': 'Addition',
+            'operand1': '2',
+            'operand2': '3',
+            'result': '5',
+            'timestamp': datetime.datetime.now().isoformat()
+        },
+        {
+            'operation': 'Division',
+            'operand1': '6',
+            'operand2': '3',
+            'result': '2',
+            'timestamp': datetime.datetime.now().isoformat()
+        }
+    ])
+    calcs = CalculatorOperations.from_dataframe(df)
+    assert len(calcs) == 2
+    assert calcs[0].result == Decimal('5')
+    assert calcs[1].result == Decimal('2')
+
+
+def test_from_dataframe_missing_column():
+    """Test DataFrame deserialization with a missing column."""
+    df = pd.DataFrame([{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'timestamp': datetime.datetime.now().isoformat()
+    }])
+    with pytest.raises(OperationError, match="Invalid calculation data"):
+        CalculatorOperations.from_dataframe(df)
+
+
+def test_from_records_trusted_skips_recompute():
+    """Test that trusted batch deserialization reuses the stored result."""
+    rows = [{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '99',  # wrong on purpose; trusted mode must not recompute
+        'timestamp': datetime.datetime.now().isoformat()
+    }]
+    calcs = CalculatorOperations.from_records(rows, trust_results=True)
+    assert calcs[0].result == Decimal('99')
+
+
+def test_from_records_verify_fixes_mismatch():
+    """Test that verified batch deserialization recomputes flagged rows."""
+    rows = [{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '99',
+        'timestamp': datetime.datetime.now().isoformat()
+    }]
+    calcs = CalculatorOperations.from_records(rows, trust_results=True, verify=True)
+    assert calcs[0].result == Decimal('5')
+
+
+def test_from_records_invalid_data():
+    """Test batch deserialization with a missing field."""
+    rows = [{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        # 'result' key is missing
+        'timestamp': datetime.datetime.now().isoformat()
+    }]
+    with pytest.raises(OperationError, match="Invalid calculation data"):
+        CalculatorOperations.from_records(rows)
+
+
+def test_from_dict_trusted_skips_recompute():
+    """Test trusted deserialization reuses the stored result as-is."""
+    data = {
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '99',  # wrong on purpose; trusted mode must not recompute
+        'timestamp': datetime.datetime.now().isoformat()
+    }
+    calc = CalculatorOperations.from_dict_trusted(data)
+    assert calc.result == Decimal('99')
+
+
+def test_from_dict_trusted_invalid_data():
+    """Test trusted deserialization with a missing field."""
+    data = {
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        # 'result' key is missing
+        'timestamp': datetime.datetime.now().isoformat()
+    }
+    with pytest.raises(OperationError, match="Invalid calculation data"):
+        CalculatorOperations.from_dict_trusted(data)
+
+
+def test_json_round_trip():
+    """Test to_json/from_json round trip."""
+    calc = CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
+    raw = calc.to_json()
+    assert isinstance(raw, bytes)
+    restored = CalculatorOperations.from_json(raw)
+    assert restored == calc
+
+
+def test_from_json_invalid_data():
+    """Test from_json with malformed input."""
+    with pytest.raises(OperationError, match="Invalid calculation data"):
+        CalculatorOperations.from_json(b'not json')
+
+
 def test_from_dict_invalid_data():
     """Test deserialization with invalid data."""
     data = {
@@ -130,6 +298,14 @@ def test_inequality():
     assert calc1 != calc2
 
 
+def test_hashable():
+    """Test that equal calculations hash equally and dedup in a set."""
+    calc1 = CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
+    calc2 = CalculatorOperations('Addition', Decimal('2'), Decimal('3'))
+    assert hash(calc1) == hash(calc2)
+    assert len({calc1, calc2}) == 1
+
+
 def test_format_result():
     """Test formatting the result with precision."""
     calc = CalculatorOperations('Division', Decimal('1'), Decimal('3'))
@@ -4,10 +4,36 @@ Unit tests for the history observer classes.
 
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from app.calculator_operations import CalculatorOperations
-from app.history import HistoryObserver, LoggingObserver, AutoSaveObserver
+from app.history import (
+    BULK_OP_CODES, HistoryObserver, LoggingObserver, AutoSaveObserver, bulk_verify
+)
+
+
+def test_bulk_verify_all_match():
+    """Test that bulk_verify accepts a batch of correct results."""
+    ops = np.array(
+        [BULK_OP_CODES['Addition'], BULK_OP_CODES['Division'], BULK_OP_CODES['Power']],
+        dtype=np.int8
+    )
+    a = np.array([2.0, 6.0, 2.0])
+    b = np.array([3.0, 3.0, 3.0])
+    r = np.array([5.0, 2.0, 8.0])
+    assert bulk_verify(ops, a, b, r).all()
+
+
+def test_bulk_verify_flags_mismatch():
+    """Test that bulk_verify flags entries whose saved result is wrong."""
+    ops = np.array([BULK_OP_CODES['Addition'], BULK_OP_CODES['Subtraction']], dtype=np.int8)
+    a = np.array([2.0, 5.0])
+    b = np.array([3.0, 3.0])
+    r = np.array([5.0, 99.0])
+    verified = bulk_verify(ops, a, b, r)
+    assert verified[0]
+    assert not verified[1]
 
 
 def test_history_observer_abstract():
@@ -32,12 +58,14 @@ def test_logging_observer_update():
         operand2=2
     )
 
-    with patch('logging.info') as mock_logging_info:
+    with patch('app.history._log') as mock_log:
         observer.update(calculator_operation)
-        mock_logging_info.assert_called_once_with(
-            f"Calculation performed: {calculator_operation.operation} "
-            f"({calculator_operation.operand1}, {calculator_operation.operand2}) = "
-            f"{calculator_operation.result}"
+        mock_log.info.assert_called_once_with(
+            "Calculation performed: %s (%s, %s) = %s",
+            calculator_operation.operation,
+            calculator_operation.operand1,
+            calculator_operation.operand2,
+            calculator_operation.result
         )
 
 
@@ -63,23 +91,82 @@ def test_auto_save_observer_update_with_none():
         observer.update(None)
 
 
-def test_auto_save_observer_update_auto_save_enabled():
-    """Test that AutoSaveObserver calls save_history when auto_save is enabled."""
+def test_auto_save_observer_update_appends_row():
+    """Test that AutoSaveObserver appends incrementally when the calculator supports it."""
     calculator_mock = Mock()
     calculator_mock.config = Mock(auto_save=True)
     calculator_mock.save_history = Mock()
 
-    observer = AutoSaveObserver(calculator_mock)
+    observer = AutoSaveObserver(calculator_mock, save_every=1)
     calculator_operation = CalculatorOperations(
         operation='Addition',
         operand1=1,
         operand2=2
     )
 
-    with patch('logging.info') as mock_logging_info:
+    observer.update(calculator_operation)
+    calculator_mock._append_history_row.assert_called_once_with(calculator_operation)
+    calculator_mock.save_history.assert_not_called()
+
+
+def test_auto_save_observer_update_auto_save_enabled():
+    """Test that AutoSaveObserver saves when only a full save_history exists."""
+    calculator_mock = Mock(spec=['config', 'save_history'])
+    calculator_mock.config = Mock(auto_save=True)
+    calculator_mock.save_history = Mock()
+
+    observer = AutoSaveObserver(calculator_mock, save_every=1)
+    calculator_operation = CalculatorOperations(
+        operation='Addition',
+        operand1=1,
+        operand2=2
+    )
+
+    with patch('app.history._log') as mock_log:
         observer.update(calculator_operation)
         calculator_mock.save_history.assert_called_once()
-        mock_logging_info.assert_called_once_with("History auto-saved")
+        mock_log.info.assert_called_once_with("History auto-saved")
+
+
+def test_auto_save_observer_batches_updates():
+    """Test that AutoSaveObserver coalesces saves up to save_every operations."""
+    calculator_mock = Mock(spec=['config', 'save_history'])
+    calculator_mock.config = Mock(auto_save=True)
+    calculator_mock.save_history = Mock()
+
+    observer = AutoSaveObserver(calculator_mock, save_every=3, save_interval=60.0)
+    calculator_operation = CalculatorOperations(
+        operation='Addition',
+        operand1=1,
+        operand2=2
+    )
+
+    observer.update(calculator_operation)
+    observer.update(calculator_operation)
+    calculator_mock.save_history.assert_not_called()
+    observer.update(calculator_operation)
+    calculator_mock.save_history.assert_called_once()
+
+
+def test_auto_save_observer_flush():
+    """Test that flush writes pending operations immediately."""
+    calculator_mock = Mock(spec=['config', 'save_history'])
+    calculator_mock.config = Mock(auto_save=True)
+    calculator_mock.save_history = Mock()
+
+    observer = AutoSaveObserver(calculator_mock, save_every=10, save_interval=60.0)
+    calculator_operation = CalculatorOperations(
+        operation='Addition',
+        operand1=1,
+        operand2=2
+    )
+
+    observer.update(calculator_operation)
+    calculator_mock.save_history.assert_not_called()
+    observer.flush()
+    calculator_mock.save_history.assert_called_once()
+    observer.flush() # Nothing pending, must not save again
+    calculator_mock.save_history.assert_called_once()
 
 
 def test_auto_save_observer_update_auto_save_disabled():
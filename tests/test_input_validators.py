@@ -9,88 +9,87 @@ from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 from app.input_validators import InputValidator
 
+# pylint: disable=redefined-outer-name
 
-def test_validate_number_with_valid_int():
+@pytest.fixture(scope='module')
+def config_1000():
+    """Shared config for the common max_input_value=1000 cases.
+
+    Module scope builds it once instead of re-running the env reads and
+    path resolution in every test.
+    """
+    return CalculatorConfig(max_input_value=Decimal('1000'))
+
+
+def test_validate_number_with_valid_int(config_1000):
     """Test validate_number with a valid integer."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number(123, config)
+    result = InputValidator.validate_number(123, config_1000)
     assert result == Decimal('123')
 
 
-def test_validate_number_with_valid_float():
+def test_validate_number_with_valid_float(config_1000):
     """Test validate_number with a valid float."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number(123.456, config)
+    result = InputValidator.validate_number(123.456, config_1000)
     assert result == Decimal('123.456')
 
 
-def test_validate_number_with_valid_str():
+def test_validate_number_with_valid_str(config_1000):
     """Test validate_number with a valid string number."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number('789', config)
+    result = InputValidator.validate_number('789', config_1000)
     assert result == Decimal('789')
 
 
-def test_validate_number_with_valid_str_float():
+def test_validate_number_with_valid_str_float(config_1000):
     """Test validate_number with a valid string float."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number('789.012', config)
+    result = InputValidator.validate_number('789.012', config_1000)
     assert result == Decimal('789.012')
 
 
-def test_validate_number_with_whitespace_str():
+def test_validate_number_with_whitespace_str(config_1000):
     """Test validate_number with a string containing whitespace."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number('  345.678  ', config)
+    result = InputValidator.validate_number('  345.678  ', config_1000)
     assert result == Decimal('345.678')
 
 
-def test_validate_number_exceeds_max_value():
+def test_validate_number_exceeds_max_value(config_1000):
     """Test validate_number with a number exceeding max_input_value."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match="Value exceeds maximum allowed: 1000"):
-        InputValidator.validate_number('1001', config)
+        InputValidator.validate_number('1001', config_1000)
 
 
-def test_validate_number_with_invalid_str():
+def test_validate_number_with_invalid_str(config_1000):
     """Test validate_number with an invalid string."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match="Invalid number format: invalid"):
-        InputValidator.validate_number('invalid', config)
+        InputValidator.validate_number('invalid', config_1000)
 
 
-def test_validate_number_with_none():
+def test_validate_number_with_none(config_1000):
     """Test validate_number with None."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match="Invalid number format: None"):
-        InputValidator.validate_number(None, config)
+        InputValidator.validate_number(None, config_1000)
 
 
-def test_validate_number_with_complex_type():
+def test_validate_number_with_complex_type(config_1000):
     """Test validate_number with an unsupported type (tuple)."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match=r"Invalid number format: \('1', '2'\)"):
-        InputValidator.validate_number(('1', '2'), config)
+        InputValidator.validate_number(('1', '2'), config_1000)
 
 
-def test_validate_number_with_negative_number():
+def test_validate_number_with_negative_number(config_1000):
     """Test validate_number with a negative number."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number('-500', config)
+    result = InputValidator.validate_number('-500', config_1000)
     assert result == Decimal('-500')
 
 
-def test_validate_number_negative_exceeds_max_value():
+def test_validate_number_negative_exceeds_max_value(config_1000):
     """Test validate_number with a negative number exceeding max_input_value."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match="Value exceeds maximum allowed: 1000"):
-        InputValidator.validate_number('-1001', config)
+        InputValidator.validate_number('-1001', config_1000)
 
 
-def test_validate_number_with_zero():
+def test_validate_number_with_zero(config_1000):
     """Test validate_number with zero."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
-    result = InputValidator.validate_number('0', config)
+    result = InputValidator.validate_number('0', config_1000)
     assert result == Decimal('0')
 
 
@@ -101,11 +100,10 @@ def test_validate_number_with_large_number_within_limit():
     assert result == Decimal('9999999999')
 
 
-def test_validate_number_with_special_characters():
+def test_validate_number_with_special_characters(config_1000):
     """Test validate_number with a string containing special characters."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
     with pytest.raises(ValidationError, match=r"Invalid number format: \$123"):
-        InputValidator.validate_number('$123', config)
+        InputValidator.validate_number('$123', config_1000)
 
 
 def test_validate_number_with_scientific_notation():
@@ -115,8 +113,8 @@ def test_validate_number_with_scientific_notation():
     assert result == Decimal('1000')
 
 
-def test_validate_number_with_infinite():
-    """Test validate_number with infinity."""
-    config = CalculatorConfig(max_input_value=Decimal('1000'))
+@pytest.mark.parametrize("spelling", ['Infinity', 'inf', 'INFINITY', '-Inf'])
+def test_validate_number_with_infinite(config_1000, spelling):
+    """Test validate_number with infinity in any spelling Decimal accepts."""
     with pytest.raises(ValidationError, match="Value exceeds maximum allowed: 1000"):
-        InputValidator.validate_number('Infinity', config)
+        InputValidator.validate_number(spelling, config_1000)
@@ -2,158 +2,169 @@
 Unit tests for the operation classes and OperationFactory.
 """
 
+import decimal
 from decimal import Decimal
+import re
+
 import pytest
 
+import app.operations as _ops
+from app.calculator_operations import OpCode
 from app.exceptions import ValidationError
-from app.operations import (
-    Operation, Addition, Subtraction, Multiplication, Division, Power, Root, OperationFactory
+from app.operations import Operation, OperationFactory
+
+# One attribute walk at import builds the class table every parametrize
+# decorator below is driven from
+OP_CLASSES = {
+    name: getattr(_ops, name)
+    for name in ('Addition', 'Subtraction', 'Multiplication', 'Division', 'Power', 'Root')
+}
+
+# Factory spellings, in the same order as OP_CLASSES
+_FACTORY_NAMES = ('add', 'subtract', 'multiply', 'divide', 'power', 'root')
+
+# Everything here is cheap; the group marks below let a parallel runner
+# (pytest-xdist --dist loadgroup) keep related cases on one worker
+pytestmark = pytest.mark.fast
+
+# The operation classes are stateless, so one shared instance per class
+# serves every test without per-test construction
+OPS = {name: cls() for name, cls in OP_CLASSES.items()}
+ADD, SUB, MUL, DIV, POW, ROOT = OPS.values()
+
+# Expected error messages compiled once; pytest.raises accepts compiled
+# patterns directly, so nothing recompiles them per test
+_DIV_ZERO = re.compile("Division by zero is not allowed")
+_NEG_EXP = re.compile("Negative exponents are not allowed")
+_ROOT_NEG = re.compile("Root of negative number cannot be calculated")
+_ZERO_ROOT = re.compile("Zero root is undefined")
+_UNKNOWN_OP = re.compile("Unknown operation: unknown")
+_UNKNOWN_CODE = re.compile("Unknown operation code")
+_BAD_REGISTER = re.compile("Operation class must inherit from Operation")
+
+# Small-integer Decimals parsed once at import; the string parser is not
+# free and these literals repeat throughout the tables below
+D0, D1, D2, D3, D4, D5, D6, D8, D16, Dm1, Dm16 = map(
+    Decimal, ('0', '1', '2', '3', '4', '5', '6', '8', '16', '-1', '-16')
 )
 
 
-def test_addition_execute():
-    """Test the execute method of Addition."""
-    addition = Addition()
-    result = addition.execute(Decimal('2'), Decimal('3'))
-    assert result == Decimal('5')
-
-
-def test_subtraction_execute():
-    """Test the execute method of Subtraction."""
-    subtraction = Subtraction()
-    result = subtraction.execute(Decimal('5'), Decimal('3'))
-    assert result == Decimal('2')
-
-
-def test_multiplication_execute():
-    """Test the execute method of Multiplication."""
-    multiplication = Multiplication()
-    result = multiplication.execute(Decimal('2'), Decimal('3'))
-    assert result == Decimal('6')
-
-
-def test_division_execute():
-    """Test the execute method of Division."""
-    division = Division()
-    result = division.execute(Decimal('6'), Decimal('3'))
-    assert result == Decimal('2')
-
-
-def test_division_by_zero():
-    """Test Division by zero raises ValidationError."""
-    division = Division()
-    with pytest.raises(ValidationError, match="Division by zero is not allowed"):
-        division.execute(Decimal('6'), Decimal('0'))
-
-
-def test_power_execute():
-    """Test the execute method of Power."""
-    power = Power()
-    result = power.execute(Decimal('2'), Decimal('3'))
-    assert result == Decimal('8')
-
-
-def test_power_negative_exponent():
-    """Test Power with negative exponent raises ValidationError."""
-    power = Power()
-    with pytest.raises(ValidationError, match="Negative exponents are not allowed"):
-        power.execute(Decimal('2'), Decimal('-1'))
-
+class DummyOperation(Operation):
+    """A dummy operation for testing factory registration."""
 
-def test_root_execute():
-    """Test the execute method of Root."""
-    root = Root()
-    result = root.execute(Decimal('16'), Decimal('2'))
-    assert result == Decimal('4')
+    def execute(self, a: Decimal, b: Decimal) -> Decimal:
+        return a
 
 
-def test_root_negative_number():
-    """Test Root with negative number raises ValidationError."""
-    root = Root()
-    with pytest.raises(ValidationError, match="Root of negative number cannot be calculated"):
-        root.execute(Decimal('-16'), Decimal('2'))
+@pytest.fixture(autouse=True)
+def _ctx():
+    """Run each test under a minimal-precision Decimal context.
 
+    The expected results are small exact integers, so prec=9 keeps the
+    C decimal module's coefficient buffers small; division by zero is
+    untrapped since the operations reject it before dividing.
+    """
+    with decimal.localcontext() as ctx:
+        ctx.prec = 9
+        ctx.traps[decimal.DivisionByZero] = 0
+        yield
 
-def test_root_zero_root():
-    """Test Root with zero as root raises ValidationError."""
-    root = Root()
-    with pytest.raises(ValidationError, match="Zero root is undefined"):
-        root.execute(Decimal('16'), Decimal('0'))
 
+@pytest.fixture(scope="session")
+def dummy_op_registered():
+    """Register DummyOperation once per session and clean it up afterwards."""
+    # Registration mutates the factory's class-level table; the teardown
+    # keeps the entry from leaking into other modules' tests
+    OperationFactory.register_operation('dummy', DummyOperation)
+    yield
+    OperationFactory._operations.pop('dummy', None) # pylint: disable=protected-access
+
+
+@pytest.mark.arith
+@pytest.mark.parametrize("op,a,b,expected", [
+    (ADD, D2, D3, D5),
+    (SUB, D5, D3, D2),
+    (MUL, D2, D3, D6),
+    (DIV, D6, D3, D2),
+    (POW, D2, D3, D8),
+    (ROOT, D16, D2, D4),
+])
+def test_execute(op, a, b, expected):
+    """Test validate_operands and execute for each operation."""
+    op.validate_operands(a, b)  # Sanity pre-check, must not raise
+    assert op.execute(a, b) == expected
+
+
+@pytest.mark.errors
+@pytest.mark.parametrize("op,a,b,exc_match", [
+    (DIV, D6, D0, _DIV_ZERO),
+    (POW, D2, Dm1, _NEG_EXP),
+    (ROOT, Dm16, D2, _ROOT_NEG),
+    (ROOT, D16, D0, _ZERO_ROOT),
+])
+def test_execute_errors(op, a, b, exc_match):
+    """Test that each invalid input raises the matching ValidationError."""
+    with pytest.raises(ValidationError, match=exc_match):
+        op.execute(a, b)
+
+
+@pytest.mark.factory
+@pytest.mark.parametrize(
+    "name,cls", list(zip(_FACTORY_NAMES, OP_CLASSES.values())), ids=_FACTORY_NAMES
+)
+def test_operation_factory_create_known_operation(name, cls):
+    """Test that OperationFactory creates each known operation correctly."""
+    # The factory instantiates the mapped class itself, never a subclass,
+    # so the exact-type check is both stricter and cheaper
+    assert type(OperationFactory.create_operation(name)) is cls
 
-def test_operation_factory_create_known_operation():
-    """Test that OperationFactory creates known operations correctly."""
-    operation = OperationFactory.create_operation('add')
-    assert isinstance(operation, Addition)
-
-    operation = OperationFactory.create_operation('subtract')
-    assert isinstance(operation, Subtraction)
 
-    operation = OperationFactory.create_operation('multiply')
-    assert isinstance(operation, Multiplication)
+@pytest.mark.factory
+def test_operation_factory_create_by_code():
+    """Test that OperationFactory creates operations from OpCode tags."""
+    operation = OperationFactory.create_by_code(OpCode.ADD)
+    assert type(operation) is OP_CLASSES['Addition']
 
-    operation = OperationFactory.create_operation('divide')
-    assert isinstance(operation, Division)
+    operation = OperationFactory.create_by_code(OpCode.ROOT)
+    assert type(operation) is OP_CLASSES['Root']
 
-    operation = OperationFactory.create_operation('power')
-    assert isinstance(operation, Power)
 
-    operation = OperationFactory.create_operation('root')
-    assert isinstance(operation, Root)
+@pytest.mark.factory
+def test_operation_factory_create_by_unknown_code():
+    """Test that OperationFactory raises ValueError for unknown codes."""
+    with pytest.raises(ValueError, match=_UNKNOWN_CODE):
+        OperationFactory.create_by_code(42)
 
 
+@pytest.mark.factory
 def test_operation_factory_create_unknown_operation():
     """Test that OperationFactory raises ValueError for unknown operations."""
-    with pytest.raises(ValueError, match="Unknown operation: unknown"):
+    with pytest.raises(ValueError, match=_UNKNOWN_OP):
         OperationFactory.create_operation('unknown')
 
 
-def test_operation_factory_register_operation():
-    """Test registering a new operation in OperationFactory."""
-
-    class DummyOperation(Operation):
-        """A dummy operation for testing purposes."""
-
-        def execute(self, a: Decimal, b: Decimal) -> Decimal:
-            return a
-
-    OperationFactory.register_operation('dummy', DummyOperation)
+@pytest.mark.factory
+def test_operation_factory_register_operation(dummy_op_registered):
+    """Test that a registered operation is created by the factory."""
     operation = OperationFactory.create_operation('dummy')
-    assert isinstance(operation, DummyOperation)
+    assert type(operation) is DummyOperation
 
 
+@pytest.mark.factory
 def test_operation_factory_register_invalid_operation():
     """Test registering an invalid operation class raises TypeError."""
 
     class InvalidOperation: # pylint: disable=too-few-public-methods
         """An invalid operation class that does not inherit from Operation."""
 
-    with pytest.raises(TypeError, match="Operation class must inherit from Operation"):
+    with pytest.raises(TypeError, match=_BAD_REGISTER):
         OperationFactory.register_operation('invalid', InvalidOperation)
 
 
-def test_operation_str():
-    """Test the __str__ method of operations."""
-    addition = Addition()
-    assert str(addition) == 'Addition'
-
-    subtraction = Subtraction()
-    assert str(subtraction) == 'Subtraction'
-
-    multiplication = Multiplication()
-    assert str(multiplication) == 'Multiplication'
-
-    division = Division()
-    assert str(division) == 'Division'
-
-    power = Power()
-    assert str(power) == 'Power'
-
-    root = Root()
-    assert str(root) == 'Root'
-
+@pytest.mark.parametrize(
+    "op,expected", [(op, name) for name, op in OPS.items()], ids=OPS.keys()
+)
+def test_operation_str(op, expected):
+    """Test the __str__ method of each operation."""
+    assert str(op) == expected
 
-def test_operation_validate_operands():
-    """Test the default validate_operands method (should pass without error)."""
-    addition = Addition()
-    addition.validate_operands(Decimal('1'), Decimal('2'))  # Should not raise an exception